@@ -1,6 +1,6 @@
 __version__ = '0.0.0'
 
 from .core import DependencyInjectionException
-from .scopes import singleton
+from .scopes import singleton, Scope
 from .container import Container, Inject
 from .qualifiers import qualifiers
@@ -1,4 +1,6 @@
-from typing import TypeVar, Generic, get_origin
+from collections.abc import Callable
+from types import UnionType
+from typing import TypeVar, Generic, Any, Union, get_origin, get_args
 
 from .qualifiers import Qualifiers
 
@@ -6,6 +8,73 @@ from .qualifiers import Qualifiers
 T = TypeVar('T')
 
 
+def _get_origin(x):
+    return get_origin(x) if hasattr(x, '__origin__') else x
+
+
+def _is_union(x) -> bool:
+    return get_origin(x) in (Union, UnionType)
+
+
+def format_target(target) -> str:
+    if isinstance(target, type) and not hasattr(target, '__origin__'):
+        return f"{target.__module__}.{target.__qualname__}"
+    return repr(target)
+
+
+def _is_assignable_arg(provided, requested) -> bool:
+    if provided == requested or provided is Any or requested is Any or isinstance(requested, TypeVar):
+        return True
+    if _is_union(provided) or _is_union(requested):
+        return is_assignable(provided, requested)
+    if isinstance(provided, type) and isinstance(requested, type):
+        return is_assignable(provided, requested)
+    if hasattr(provided, '__origin__') or hasattr(requested, '__origin__'):
+        return is_assignable(provided, requested)
+    return False
+
+
+def is_assignable(provided, requested) -> bool:
+    """Checks whether a provided target type can be injected where the requested target type is expected.
+
+    Origins are compared by subclassing. If both targets are parameterized with the same origin, their
+    arguments are compared as well: callables are contravariant in their parameters and covariant in their
+    return type, other generics are covariant in their arguments. Variadic tuples accept tuples of any length.
+    Unparameterized targets match any arguments. A union is provided if all of its members are assignable and
+    requested if any of its members is.
+    """
+    if _is_union(provided):
+        return all(is_assignable(p, requested) for p in get_args(provided))
+    if _is_union(requested):
+        return any(is_assignable(provided, r) for r in get_args(requested))
+    provided_origin = _get_origin(provided)
+    requested_origin = _get_origin(requested)
+    if not isinstance(provided_origin, type) or not isinstance(requested_origin, type):
+        return provided == requested
+    if not issubclass(provided_origin, requested_origin):
+        return False
+    provided_args = get_args(provided)
+    requested_args = get_args(requested)
+    if len(provided_args) == 0 or len(requested_args) == 0 or provided_origin is not requested_origin:
+        return True
+    if requested_origin is Callable:
+        (provided_params, provided_return) = provided_args
+        (requested_params, requested_return) = requested_args
+        if requested_params is not Ellipsis and provided_params is not Ellipsis:
+            if len(provided_params) != len(requested_params):
+                return False
+            if not all(_is_assignable_arg(r, p) for (p, r) in zip(provided_params, requested_params)):
+                return False
+        return _is_assignable_arg(provided_return, requested_return)
+    if requested_origin is tuple and len(requested_args) == 2 and requested_args[1] is Ellipsis:
+        if len(provided_args) == 2 and provided_args[1] is Ellipsis:
+            provided_args = provided_args[:1]
+        return all(_is_assignable_arg(p, requested_args[0]) for p in provided_args)
+    if len(provided_args) != len(requested_args):
+        return False
+    return all(_is_assignable_arg(p, r) for (p, r) in zip(provided_args, requested_args))
+
+
 class Component(Generic[T]):
 
     def __init__(self, target: type[T], qualifiers: Qualifiers):
@@ -38,9 +107,7 @@ class Component(Generic[T]):
         return self.target == other.target and self.qualifiers == other.qualifiers
 
     def __str__(self):
-        return f"{self.target.__module__}.{self.target.__qualname__}[{str(self.qualifiers)}]"
+        return f"{format_target(self.target)}[{str(self.qualifiers)}]"
 
     def satisfies(self, request):
-        def _get_origin(x): return get_origin(x) if hasattr(x, '__origin__') else x
-        return issubclass(_get_origin(self.target), _get_origin(request.target)) \
-            and request.qualifiers.is_subset(self.qualifiers)
+        return is_assignable(self.target, request.target) and request.qualifiers.is_subset(self.qualifiers)
@@ -1,12 +1,17 @@
-from typing import Callable, Annotated, TypeVar, Any
+from typing import Callable, Annotated, TypeVar, Any, Iterator
+from contextlib import contextmanager
 import inspect
 
 from makefun import wraps
 
 from .qualifiers import Qualifiers
 from .component import Component, T
+from .graph import DependencyGraph, Node
 from .injection import InjectionContext, Injector
-from .registry import DictRegistry, Unconstrained, Constraint, AmbiguousDependencyException, UnsatisfiedDependencyException
+from .memory import MemoryTracker, MemoryStats
+from .profiling import ResolutionProfiler
+from .scopes import SINGLETON, get_scope, singleton
+from .registry import Registry, DictRegistry, Unconstrained, Constraint, AmbiguousDependencyException, UnsatisfiedDependencyException
 
 
 Inject = Annotated[TypeVar('T'), Qualifiers('default')]
@@ -18,6 +23,7 @@ class Container(InjectionContext):
         self._name = name
         self._registry = DictRegistry()
         self._dependencies: dict[Container, list[Component[T], ...]] = dict()
+        self._dependencies_version: int = 0
         super(Container, self).__init__()
 
     @property
@@ -43,10 +49,11 @@ class Container(InjectionContext):
                 nonlocal target
                 if target is None:
                     sig = inspect.signature(func)
-                    return_type = sig.return_annotation
-                    param_types = [p.annotation for p in sig.parameters.values()]
+                    def _annotation(a): return Any if a is inspect.Parameter.empty else a
+                    return_type = _annotation(sig.return_annotation)
+                    param_types = [_annotation(p.annotation) for p in sig.parameters.values()]
                     target = Callable[[*param_types], return_type]
-                _register_provider(target, qualifiers, lambda: func)
+                _register_provider(target, qualifiers, singleton()(lambda: func))
                 return func
             return _func_decorator
 
@@ -108,17 +115,28 @@ class Container(InjectionContext):
                 args, kwargs = injector(self, args, kwargs)
                 return func(*args, **kwargs)
 
+            _wrapper.injector = injector
+            _wrapper.injection_context = self
             return _wrapper
 
         return _decorator
 
-    def resolve(self, request: Component[T], *, many: bool = False, named: bool = False, constraint: Constraint = Unconstrained) -> T:
+    def _lookup(self, request: Component[T], constraint: Constraint = Unconstrained) -> list[tuple['Container', dict[Component[T], Callable[[], T]]]]:
+        sources = [(self, self.registry.lookup(request, constraint=constraint))]
+        for (container, container_constraint) in self._dependencies.items():
+            sources.append((container, container.registry.lookup(
+                request, constraint=lambda c: constraint(c) and container_constraint(c))))
+        return sources
+
+    def _instantiate(self, request: Component[T], sources: list[tuple['Container', dict[Component[T], Callable[[], T]]]], *,
+                     many: bool = False, named: bool = False) -> T:
         if many:
-            instances = self.registry.resolve(request, many=True, named=named, constraint=constraint)
-            for (container, container_constraint) in self._dependencies.items():
-                dependencies = container.registry.resolve(request, many=True, named=named,
-                                                          constraint=lambda c: constraint(c) and container_constraint(c))
-                if named:
+            instances = None
+            for (container, factories) in sources:
+                dependencies = container.registry.instantiate(request, factories, many=True, named=named)
+                if instances is None:
+                    instances = dependencies
+                elif named:
                     duplicates = set(instances.keys()).intersection(set(dependencies.keys()))
                     if len(duplicates):
                         raise AmbiguousDependencyException(f"Multiple components with same name resolved: {','.join(duplicates)}")
@@ -131,15 +149,9 @@ class Container(InjectionContext):
         instance = None
         origin = None
         usdexc = None
-        try:
-            instance = self.registry.resolve(request, many=False, named=False, constraint=constraint)
-            origin = self
-        except UnsatisfiedDependencyException as e:
-            usdexc = e
-        for (container, container_constraints) in self._dependencies.items():
+        for (container, factories) in sources:
             try:
-                instance = container.registry.resolve(request, many=False, named=False,
-                                                      constraint=lambda c: constraint(c) and container_constraints(c))
+                instance = container.registry.instantiate(request, factories, many=False, named=False)
                 if origin is not None:
                     raise AmbiguousDependencyException(f"Ambiguous dependency {request} received from containers {origin.name} and {container.name}.")
                 origin = container
@@ -149,12 +161,120 @@ class Container(InjectionContext):
             raise UnsatisfiedDependencyException(f"Cannot resolve dependency {request}") from usdexc
         return instance
 
+    def resolve(self, request: Component[T], *, many: bool = False, named: bool = False, constraint: Constraint = Unconstrained) -> T:
+        return self._instantiate(request, self._lookup(request, constraint), many=many, named=named)
+
+    def _state(self) -> tuple[int, ...]:
+        return (self._dependencies_version, self.registry.version, *(c.registry.version for c in self._dependencies.keys()))
+
+    def resolve_scoped(self, request: Component[T], *, many: bool = False, named: bool = False) -> tuple[T, Any]:
+        """Resolves the request, the token is only returned if all resolved providers have singleton lifetime."""
+        sources = self._lookup(request)
+        scopes = [get_scope(factory) for (_, factories) in sources for factory in factories.values()]
+        token = None
+        if all(scope is not None and scope.lifetime == SINGLETON for scope in scopes):
+            token = (self._state(), tuple((scope, scope.generation) for scope in scopes))
+        return self._instantiate(request, sources, many=many, named=named), token
+
+    def is_current(self, token: Any) -> bool:
+        return token is not None and token[0] == self._state() \
+            and all(scope.generation == generation for (scope, generation) in token[1])
+
+    def on_invalidate(self, token: Any, callback: Callable[[], None]) -> None:
+        for (scope, _) in token[1]:
+            scope.on_reset(callback)
+
+    def _reachable_containers(self) -> list['Container']:
+        containers = [self]
+        idx = 0
+        while idx < len(containers):
+            for dependency in containers[idx]._dependencies.keys():
+                if dependency not in containers:
+                    containers.append(dependency)
+            idx += 1
+        return containers
+
+    @contextmanager
+    def profile(self, profiler: ResolutionProfiler | None = None) -> Iterator[ResolutionProfiler]:
+        """Records all factory calls of this container and the containers it requires from while in the context."""
+        if profiler is None:
+            profiler = ResolutionProfiler()
+        registries = [container.registry for container in self._reachable_containers()]
+        previous = [registry.profiler for registry in registries]
+        for registry in registries:
+            registry.profiler = profiler
+        try:
+            yield profiler
+        finally:
+            for (registry, p) in zip(registries, previous):
+                registry.profiler = p
+
+    @contextmanager
+    def track_memory(self, tracker: MemoryTracker | None = None) -> Iterator[MemoryTracker]:
+        """Accounts memory per component for this container and the containers it requires from while in the context.
+
+        A tracker already attached to one of these containers is reused. While tracking, tracemalloc traces all
+        allocations of the process, which slows down the program.
+        """
+        registries = [container.registry for container in self._reachable_containers()]
+        if tracker is None:
+            tracker = next((r.memory_tracker for r in registries if r.memory_tracker is not None), None) or MemoryTracker()
+        previous = [registry.memory_tracker for registry in registries]
+        tracker.start()
+        for registry in registries:
+            registry.memory_tracker = tracker
+        try:
+            yield tracker
+        finally:
+            for (registry, t) in zip(registries, previous):
+                registry.memory_tracker = t
+            tracker.stop()
+
+    def memory_report(self) -> dict[tuple[Registry, Component[Any]], MemoryStats]:
+        if self.registry.memory_tracker is None:
+            raise ValueError(f"Memory tracking is not enabled for container {self.name}.")
+        return self.registry.memory_tracker.report()
+
+    def _lookup_all(self, request: Component[T]) -> list[Node]:
+        """Returns the components the request would be resolved from, without calling any factory."""
+        return [(container, c) for (container, factories) in self._lookup(request) for c in factories.keys()]
+
+    def graph(self) -> DependencyGraph:
+        """Builds the dependency graph of the providers in this container and all containers they resolve from."""
+        containers = self._reachable_containers()
+        edges: dict[Node, tuple[Node, ...]] = dict()
+        unsatisfied: dict[Node, tuple[Component[Any], ...]] = dict()
+        idx = 0
+        while idx < len(containers):
+            container = containers[idx]
+            idx += 1
+            for (component, factory) in container.registry.items().items():
+                node = (container, component)
+                injector: Injector | None = getattr(factory, 'injector', None)
+                context: Container | None = getattr(factory, 'injection_context', None)
+                children = list()
+                missing = list()
+                if injector is not None and context is not None:
+                    for (param, request) in injector.components.items():
+                        matches = context._lookup_all(request)
+                        if len(matches) == 0 and param.kind not in {inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD}:
+                            missing.append(request)
+                        children.extend(m for m in matches if m not in children)
+                    for c in [context, *context._dependencies.keys()]:
+                        if c not in containers:
+                            containers.append(c)
+                edges[node] = tuple(children)
+                if len(missing):
+                    unsatisfied[node] = tuple(missing)
+        return DependencyGraph(edges, unsatisfied)
+
     def expose_to(self, other: 'Container', target: type[T], *tags: str, **params: str) -> None:
         other.require_from(self, target, *tags, **params)
 
     def require_from(self, other: 'Container', target: type[T], *tags: str, **params: str) -> None:
         request = Component(target, Qualifiers(*tags, **params))
         constraint: Constraint = lambda c: c.satisfies(request)
+        self._dependencies_version += 1
         if other not in self._dependencies:
             self._dependencies[other] = constraint
         else:
@@ -0,0 +1,160 @@
+import json
+from typing import Any
+
+from .component import Component
+from .registry import ResolutionException
+
+
+class CyclicDependencyException(ResolutionException):
+    pass
+
+
+Node = tuple[Any, Component[Any]]  # (container, component)
+
+
+class DependencyGraph(object):
+    """Static dependency graph between providers, derived without calling any factory.
+
+    Nodes are pairs of a container and a component registered in it. An edge points from a provider to
+    each provider its injector may resolve through the injection context of the provider.
+    """
+
+    def __init__(self,
+                 edges: dict[Node, tuple[Node, ...]],
+                 unsatisfied: dict[Node, tuple[Component[Any], ...]]):
+        self._edges = edges
+        self._unsatisfied = unsatisfied
+        self._components = self._find_strongly_connected_components()
+        self._depths = self._compute_depths()
+        self._ids = self._assign_ids()
+
+    @property
+    def nodes(self) -> tuple[Node, ...]:
+        return tuple(self._edges.keys())
+
+    @property
+    def edges(self) -> dict[Node, tuple[Node, ...]]:
+        return dict(self._edges)
+
+    @property
+    def unsatisfied(self) -> dict[Node, tuple[Component[Any], ...]]:
+        """Injected components of single-valued parameters without any matching provider, per node."""
+        return dict(self._unsatisfied)
+
+    def fan_out(self, node: Node) -> int:
+        return len(self._edges[node])
+
+    def depth(self, node: Node) -> int | None:
+        """Length of the longest chain of nested resolutions starting at the node, None if it reaches a cycle."""
+        return self._depths[node]
+
+    def cycles(self) -> list[tuple[Node, ...]]:
+        return [scc for scc in self._components if self._is_cyclic(scc)]
+
+    def check(self) -> None:
+        cycles = self.cycles()
+        if len(cycles):
+            raise CyclicDependencyException('Cyclic dependencies detected: ' + '; '.join(
+                ' -> '.join(self._node_id(n) for n in (*cycle, cycle[0])) for cycle in cycles))
+
+    def _is_cyclic(self, scc: tuple[Node, ...]) -> bool:
+        return len(scc) > 1 or scc[0] in self._edges[scc[0]]
+
+    def _find_strongly_connected_components(self) -> list[tuple[Node, ...]]:
+        """Tarjan's algorithm without recursion, components are returned in reverse topological order."""
+        index: dict[Node, int] = dict()
+        low: dict[Node, int] = dict()
+        stack: list[Node] = list()
+        on_stack: set[Node] = set()
+        components: list[tuple[Node, ...]] = list()
+        for root in self._edges.keys():
+            if root in index:
+                continue
+            work = [(root, 0)]
+            while len(work):
+                (node, child_idx) = work.pop()
+                if child_idx == 0:
+                    index[node] = low[node] = len(index)
+                    stack.append(node)
+                    on_stack.add(node)
+                children = self._edges[node]
+                if child_idx > 0:
+                    low[node] = min(low[node], low[children[child_idx - 1]])
+                while child_idx < len(children) and children[child_idx] in index:
+                    if children[child_idx] in on_stack:
+                        low[node] = min(low[node], index[children[child_idx]])
+                    child_idx += 1
+                if child_idx < len(children):
+                    work.append((node, child_idx + 1))
+                    work.append((children[child_idx], 0))
+                elif low[node] == index[node]:
+                    scc = list()
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        scc.append(member)
+                        if member == node:
+                            break
+                    components.append(tuple(reversed(scc)))
+        return components
+
+    def _compute_depths(self) -> dict[Node, int | None]:
+        depths: dict[Node, int | None] = dict()
+        for scc in self._components:  # Dependencies are processed before their dependents.
+            if self._is_cyclic(scc):
+                depth = None
+            else:
+                children = [depths[child] for child in self._edges[scc[0]]]
+                depth = None if None in children else 1 + max(children, default=-1)
+            for node in scc:
+                depths[node] = depth
+        return depths
+
+    def _assign_ids(self) -> dict[Node, str]:
+        """Assigns readable ids to the nodes, numbering those which would otherwise be indistinguishable."""
+        ids = dict()
+        used = set()
+        for (container, component) in self._edges.keys():
+            base = f"{container.name}:{component}"
+            node_id = base
+            suffix = 1
+            while node_id in used:
+                suffix += 1
+                node_id = f"{base}#{suffix}"
+            used.add(node_id)
+            ids[(container, component)] = node_id
+        return ids
+
+    def _node_id(self, node: Node) -> str:
+        return self._ids[node]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'nodes': [{'id': self._node_id(n), 'container': n[0].name, 'component': str(n[1]),
+                       'depth': self._depths[n], 'fan_out': self.fan_out(n)} for n in self._edges.keys()],
+            'edges': [{'source': self._node_id(n), 'target': self._node_id(c)}
+                      for (n, children) in self._edges.items() for c in children],
+            'cycles': [[self._node_id(n) for n in cycle] for cycle in self.cycles()],
+            'unsatisfied': {self._node_id(n): [str(c) for c in components]
+                            for (n, components) in self._unsatisfied.items()},
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_dot(self) -> str:
+        def _quote(x: str) -> str:
+            return '"' + str(x).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        cyclic = set(n for cycle in self.cycles() for n in cycle)
+        lines = ['digraph dependencies {']
+        for n in self._edges.keys():
+            depth = '-' if self._depths[n] is None else self._depths[n]
+            attrs = f"label={_quote(self._node_id(n) + chr(10) + f'depth={depth} fan_out={self.fan_out(n)}')}"
+            if n in cyclic:
+                attrs += ', color=red'
+            lines.append(f"    {_quote(self._node_id(n))} [{attrs}];")
+        for (n, children) in self._edges.items():
+            for c in children:
+                lines.append(f"    {_quote(self._node_id(n))} -> {_quote(self._node_id(c))};")
+        lines.append('}')
+        return '\n'.join(lines) + '\n'
@@ -20,6 +20,20 @@ class InjectionContext(ABC):
                 ) -> T | tuple[T, ...] | dict[str, T]:
         raise NotImplementedError()
 
+    def resolve_scoped(self, request: Component[T], *,
+                       many: bool = False,
+                       named: bool = False,
+                       ) -> tuple[T | tuple[T, ...] | dict[str, T], Any]:
+        """Resolves the request and returns a token which stays current as long as the value may be reused."""
+        return self.resolve(request, many=many, named=named), None
+
+    def is_current(self, token: Any) -> bool:
+        return False
+
+    def on_invalidate(self, token: Any, callback: Callable[[], None]) -> None:
+        """Registers a callback to be called as soon as the scopes of the token are reset."""
+        pass
+
 
 def get_component(parameter: Parameter) -> Component:
     if not hasattr(parameter.annotation, '__metadata__'):
@@ -41,11 +55,32 @@ class Injector:
     def __init__(self, function: Callable):
         self._parameters = tuple(signature(function).parameters.values())
         self._components = get_components(self._parameters)
+        self._cache: dict[Parameter, tuple[InjectionContext, Any, Any]] = dict()
+
+    @property
+    def components(self) -> dict[Parameter, Component]:
+        return dict(self._components)
 
     @property
     def parameters(self):
         return set(p.name for p in self._components.keys())
 
+    def _resolve(self, context: InjectionContext, param: Parameter, **resolve_kwargs) -> Any:
+        """Resolves param, reusing the value of a previous call while its scopes are unchanged."""
+        cached = self._cache.get(param)
+        if cached is not None and cached[0] is context and context.is_current(cached[2]):
+            return cached[1]
+        value, token = context.resolve_scoped(self._components[param], **resolve_kwargs)
+        if token is None:
+            self._cache.pop(param, None)
+        else:
+            self._cache[param] = (context, value, token)
+            context.on_invalidate(token, self._clear_cache)
+        return value
+
+    def _clear_cache(self) -> None:
+        self._cache.clear()
+
     def __call__(self,
                  context: InjectionContext,
                  args: Tuple[Any, ...],
@@ -72,7 +107,7 @@ class Injector:
 
         def _resolve_param(**resolve_kwargs):
             """Resolves param using its component and the injection context."""
-            return context.resolve(self._components[param], **resolve_kwargs)
+            return self._resolve(context, param, **resolve_kwargs)
 
         # Fill positional parameters.
         while _init_next_param({Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD}):
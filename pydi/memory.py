@@ -0,0 +1,132 @@
+import gc
+import sys
+import tracemalloc
+from types import ModuleType, FunctionType
+from typing import Any, Callable
+
+from .component import Component, T
+from .injection import InjectionContext
+from .scopes import SINGLETON, get_scope
+
+
+def get_retained_size(instance: Any) -> int:
+    """Approximates the memory retained by an instance as the size of all objects reachable from it.
+
+    Types, modules and functions are shared with the rest of the program and are not traversed.
+    """
+    seen = set()
+    size = 0
+    pending = [instance]
+    while len(pending):
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, (type, ModuleType, FunctionType)):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        pending.extend(gc.get_referents(obj))
+    return size
+
+
+class MemoryStats(object):
+
+    def __init__(self, registry: InjectionContext, component: Component[Any]):
+        self._registry = registry
+        self._component = component
+        self._created: int = 0
+        self._allocated_bytes: int = 0
+        self._self_bytes: int = 0
+        self._retained_bytes: int | None = None
+
+    @property
+    def registry(self) -> InjectionContext:
+        return self._registry
+
+    @property
+    def component(self) -> Component[Any]:
+        return self._component
+
+    @property
+    def created(self) -> int:
+        """Number of factory calls."""
+        return self._created
+
+    @property
+    def allocated_bytes(self) -> int:
+        """Memory allocated and still traced after the factory calls, including nested components."""
+        return self._allocated_bytes
+
+    @property
+    def self_bytes(self) -> int:
+        """Memory allocated by the factory calls, excluding nested components."""
+        return self._self_bytes
+
+    @property
+    def retained_bytes(self) -> int | None:
+        """Memory retained by the live instance of a singleton-scoped component, None for other components."""
+        return self._retained_bytes
+
+    def __str__(self):
+        retained = '-' if self._retained_bytes is None else str(self._retained_bytes)
+        return (f"{self._component}: created={self._created} allocated={self._allocated_bytes}B "
+                f"self={self._self_bytes}B retained={retained}B")
+
+
+class MemoryTracker(object):
+    """Attributes memory traced by tracemalloc to the components whose factories allocated it.
+
+    Tracing is started by the first start() unless it is already running, and stopped by the matching last stop().
+    Calls of singleton providers returning their cached instance are not counted. The tracker keeps a single call
+    stack and is therefore not thread-safe.
+    """
+
+    def __init__(self):
+        self._stats: dict[tuple[InjectionContext, Component[Any]], MemoryStats] = dict()
+        self._singletons: dict[tuple[InjectionContext, Component[Any]], Callable[[], Any]] = dict()
+        self._stack: list[int] = list()
+        self._users: int = 0
+        self._started_tracing: bool = False
+
+    def start(self) -> None:
+        if self._users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._users += 1
+
+    def stop(self) -> None:
+        self._users -= 1
+        if self._users == 0 and self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def create(self, registry: InjectionContext, component: Component[T], factory: Callable[[], T]) -> T:
+        is_cached = getattr(factory, 'is_cached', None)
+        if is_cached is not None and is_cached():
+            return factory()
+        self._stack.append(0)
+        before = tracemalloc.get_traced_memory()[0]
+        try:
+            instance = factory()
+        finally:
+            allocated = tracemalloc.get_traced_memory()[0] - before
+            nested = self._stack.pop()
+            if len(self._stack):
+                self._stack[-1] += allocated
+        key = (registry, component)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = MemoryStats(registry, component)
+        stats._created += 1
+        stats._allocated_bytes += allocated
+        stats._self_bytes += allocated - nested
+        scope = get_scope(factory)
+        if scope is not None and scope.lifetime == SINGLETON and hasattr(factory, 'get_instance'):
+            self._singletons[key] = factory
+        return instance
+
+    def report(self) -> dict[tuple[InjectionContext, Component[Any]], MemoryStats]:
+        """Returns the memory statistics per registry and component, updating the retained size of live singleton
+        instances."""
+        for (key, factory) in self._singletons.items():
+            instance = factory.get_instance()
+            self._stats[key]._retained_bytes = None if instance is None else get_retained_size(instance)
+        return dict(self._stats)
@@ -0,0 +1,124 @@
+from time import perf_counter
+from typing import Any, Callable
+
+from .component import Component, T
+from .injection import InjectionContext
+
+
+class ProfileNode(object):
+
+    def __init__(self,
+                 registry: InjectionContext,
+                 component: Component[Any],
+                 factory: Callable[[], Any],
+                 parent: 'ProfileNode | None'):
+        self._registry = registry
+        self._component = component
+        self._factory = factory
+        self._parent = parent
+        self._children: list[ProfileNode] = list()
+        self._start: float = 0.0
+        self._end: float = 0.0
+
+    @property
+    def registry(self) -> InjectionContext:
+        return self._registry
+
+    @property
+    def component(self) -> Component[Any]:
+        return self._component
+
+    @property
+    def parent(self) -> 'ProfileNode | None':
+        return self._parent
+
+    @property
+    def children(self) -> tuple['ProfileNode', ...]:
+        return tuple(self._children)
+
+    @property
+    def name(self) -> str:
+        factory_name = getattr(self._factory, '__qualname__', None) or getattr(self._factory, '__name__', '?')
+        return f"{factory_name}({self._component})".replace(';', ',')
+
+    @property
+    def wall_time(self) -> float:
+        return self._end - self._start
+
+    @property
+    def self_time(self) -> float:
+        return self.wall_time - sum(child.wall_time for child in self._children)
+
+    def __str__(self):
+        return f"{self.name}: wall={self.wall_time * 1000:.3f}ms self={self.self_time * 1000:.3f}ms"
+
+
+class ResolutionProfiler(object):
+    """Records the nested factory calls of one or more registries as a tree of timed nodes.
+
+    The profiler keeps a single call stack and is therefore not thread-safe.
+    """
+
+    def __init__(self):
+        self._roots: list[ProfileNode] = list()
+        self._stack: list[ProfileNode] = list()
+
+    @property
+    def roots(self) -> tuple[ProfileNode, ...]:
+        return tuple(self._roots)
+
+    def create(self, registry: InjectionContext, component: Component[T], factory: Callable[[], T]) -> T:
+        parent = self._stack[-1] if len(self._stack) else None
+        node = ProfileNode(registry, component, factory, parent)
+        (parent._children if parent is not None else self._roots).append(node)
+        self._stack.append(node)
+        node._start = perf_counter()
+        try:
+            return factory()
+        finally:
+            node._end = perf_counter()
+            self._stack.pop()
+
+    def nodes(self) -> list[ProfileNode]:
+        nodes = list()
+        pending = list(reversed(self._roots))
+        while len(pending):
+            node = pending.pop()
+            nodes.append(node)
+            pending.extend(reversed(node._children))
+        return nodes
+
+    def summary(self) -> dict[tuple[InjectionContext, Component[Any]], tuple[float, float]]:
+        """Returns the accumulated wall and self time per registry and component."""
+        totals: dict[tuple[InjectionContext, Component[Any]], tuple[float, float]] = dict()
+        for node in self.nodes():
+            key = (node.registry, node.component)
+            (wall, own) = totals.get(key, (0.0, 0.0))
+            totals[key] = (wall + node.wall_time, own + node.self_time)
+        return totals
+
+    def critical_path(self) -> list[ProfileNode]:
+        """Returns the chain of nested factory calls that took the most wall time, starting from a root."""
+        path = list()
+        candidates = self._roots
+        while len(candidates):
+            node = max(candidates, key=lambda n: n.wall_time)
+            path.append(node)
+            candidates = node._children
+        return path
+
+    def to_collapsed(self) -> str:
+        """Exports the recorded calls as collapsed stacks with self time in microseconds (flamegraph.pl, speedscope)."""
+        lines = list()
+        for node in self.nodes():
+            frames = list()
+            n = node
+            while n is not None:
+                frames.append(n.name)
+                n = n.parent
+            lines.append(f"{';'.join(reversed(frames))} {max(round(node.self_time * 1e6), 0)}")
+        return '\n'.join(lines) + ('\n' if len(lines) else '')
+
+    def write_collapsed(self, path: str) -> None:
+        with open(path, 'w') as file:
+            file.write(self.to_collapsed())
@@ -1,9 +1,90 @@
+from typing import Callable
+
+
 DEFAULT: str = 'default'
 ANY: str = 'any'
 ALTERNATIVE: str = 'alternative'
 NAME: str = 'name'
 
 
+class Selector(object):
+    """Matches the value of a qualifier parameter of a provider, used in place of a value in injector qualifiers."""
+
+    def matches(self, value: str) -> bool:
+        raise NotImplementedError()
+
+
+class Prefix(Selector):
+
+    def __init__(self, prefix: str):
+        self._prefix = prefix
+
+    @property
+    def prefix(self) -> str:
+        return self._prefix
+
+    def matches(self, value: str) -> bool:
+        return isinstance(value, str) and value.startswith(self._prefix)
+
+    def __hash__(self):
+        return hash((Prefix, self._prefix))
+
+    def __eq__(self, other):
+        return isinstance(other, Prefix) and self._prefix == other._prefix
+
+    def __str__(self):
+        return f"{self._prefix}*"
+
+
+class OneOf(Selector):
+
+    def __init__(self, *values: str):
+        self._values: frozenset[str] = frozenset(values)
+
+    @property
+    def values(self) -> frozenset[str]:
+        return self._values
+
+    def matches(self, value: str) -> bool:
+        return value in self._values
+
+    def __hash__(self):
+        return hash((OneOf, self._values))
+
+    def __eq__(self, other):
+        return isinstance(other, OneOf) and self._values == other._values
+
+    def __str__(self):
+        return '{' + '|'.join(sorted(self._values)) + '}'
+
+
+class Predicate(Selector):
+    """Opaque selector, cannot be evaluated using an index."""
+
+    def __init__(self, predicate: Callable[[str], bool]):
+        self._predicate = predicate
+
+    def matches(self, value: str) -> bool:
+        return self._predicate(value)
+
+    def __str__(self):
+        return getattr(self._predicate, '__name__', 'predicate') + '()'
+
+
+def _as_param_value(value):
+    if isinstance(value, (set, frozenset)):
+        return OneOf(*value)
+    if callable(value) and not isinstance(value, Selector):
+        return Predicate(value)
+    return value
+
+
+def _matches(requested, provided) -> bool:
+    if isinstance(requested, Selector):
+        return requested.matches(provided)
+    return requested == provided
+
+
 class Qualifiers(object):
 
     @classmethod
@@ -12,6 +93,8 @@ class Qualifiers(object):
             tags = (DEFAULT, ANY)
         if ANY not in tags:
             tags += (ANY,)
+        if any(isinstance(_as_param_value(v), Selector) for v in params.values()):
+            raise ValueError('Selectors can only be used in injector qualifiers.')
         return cls(*tags, **params)
 
     @classmethod
@@ -20,14 +103,15 @@ class Qualifiers(object):
             tags = (DEFAULT,)
         return cls(*tags, **params)
 
-    def __init__(self, *tags: str, **params: str):
+    def __init__(self, *tags: str, **params: str | Selector):
+        params = {k: _as_param_value(v) for (k, v) in params.items()}
         tags = set(tags)
         for p in tags:
             if p in params.keys():
                 raise ValueError(f"Duplicate qualifier '{p}' found in tags and parameters.")
         self._tags: tuple[str, ...] = tuple(sorted(set(tags)))
-        self._params: dict[str, str] = params
-        self._sorted_params: tuple[tuple[str, str], ...] = tuple((k, v) for (k, v) in sorted(params.items()))
+        self._params: dict[str, str | Selector] = params
+        self._sorted_params: tuple[tuple[str, str | Selector], ...] = tuple(sorted(params.items(), key=lambda kv: kv[0]))
         self._hash: int = (301 + hash(tuple(sorted(self._tags)))) ^ hash(self._sorted_params)
 
     def __hash__(self):
@@ -43,7 +127,11 @@ class Qualifiers(object):
         return self._tags == other._tags and self._sorted_params == other._sorted_params
 
     def __str__(self):
-        return ','.join(self._tags + tuple('='.join(kw) for kw in self._sorted_params))
+        return ','.join(self._tags + tuple(f"{k}={v}" for (k, v) in self._sorted_params))
+
+    @property
+    def params(self) -> tuple[tuple[str, str | Selector], ...]:
+        return self._sorted_params
 
     def __getitem__(self, key):
         if key not in self._params and key in self._tags:
@@ -54,6 +142,7 @@ class Qualifiers(object):
         return other.is_superset(self)
 
     def is_superset(self, other: 'Qualifiers'):
+        """Checks whether all tags and parameters of other are contained, selectors in other are evaluated."""
         if self is other:
             return True
         if len(self._tags) < len(other._tags) or len(self._sorted_params) < len(other._sorted_params):
@@ -69,7 +158,8 @@ class Qualifiers(object):
         for param in other._sorted_params:
             while idx_param < len(self._sorted_params) and self._sorted_params[idx_param][0] < param[0]:
                 idx_param += 1
-            if idx_param >= len(self._sorted_params) or param != self._sorted_params[idx_param]:
+            if idx_param >= len(self._sorted_params) or param[0] != self._sorted_params[idx_param][0] \
+                    or not _matches(param[1], self._sorted_params[idx_param][1]):
                 return False
             idx_param += 1
         return True
@@ -1,10 +1,14 @@
 from abc import abstractmethod
+from bisect import bisect_left
+from functools import partial, update_wrapper
 from typing import Callable, Any
 
-from .component import Component, T
+from .component import Component, T, is_assignable
 from .core import DependencyInjectionException
-from .qualifiers import NAME
+from .qualifiers import NAME, Qualifiers, Prefix, OneOf
 from .injection import InjectionContext
+from .memory import MemoryTracker
+from .profiling import ResolutionProfiler
 
 
 class ResolutionException(DependencyInjectionException):
@@ -31,26 +35,70 @@ def Unconstrained(_: Component[Any]) -> bool:
 
 class Registry(InjectionContext):
 
+    def __init__(self):
+        self._profiler: ResolutionProfiler | None = None
+        self._memory_tracker: MemoryTracker | None = None
+        self._version: int = 0
+        super(Registry, self).__init__()
+
+    @property
+    def version(self) -> int:
+        """Incremented whenever a component is registered."""
+        return self._version
+
+    @property
+    def profiler(self) -> ResolutionProfiler | None:
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler: ResolutionProfiler | None) -> None:
+        self._profiler = profiler
+
+    @property
+    def memory_tracker(self) -> MemoryTracker | None:
+        return self._memory_tracker
+
+    @memory_tracker.setter
+    def memory_tracker(self, memory_tracker: MemoryTracker | None) -> None:
+        self._memory_tracker = memory_tracker
+
     @abstractmethod
     def register(self, component: Component[T], factory: Factory[T]) -> None:
         raise NotImplementedError()
 
+    @abstractmethod
+    def items(self) -> dict[Component[T], Factory[T]]:
+        raise NotImplementedError()
+
     @abstractmethod
     def lookup(self, request: Component[T], *, constraint: Constraint = Unconstrained) -> dict[Component[T], Factory[T]]:
         raise NotImplementedError()
 
+    def _create(self, component: Component[T], factory: Factory[T]) -> T:
+        if self._memory_tracker is not None:
+            factory = update_wrapper(partial(self._memory_tracker.create, self, component, factory), factory)
+        if self._profiler is None:
+            return factory()
+        return self._profiler.create(self, component, factory)
+
     def resolve(self, request: Component[T], *,
                 many: bool = False,
                 named: bool = False,
                 constraint: Constraint = Unconstrained,
                 ) -> T | tuple[T, ...] | dict[str, T]:
-        factories = self.lookup(request, constraint=constraint)
+        return self.instantiate(request, self.lookup(request, constraint=constraint), many=many, named=named)
+
+    def instantiate(self, request: Component[T], factories: dict[Component[T], Factory[T]], *,
+                    many: bool = False,
+                    named: bool = False,
+                    ) -> T | tuple[T, ...] | dict[str, T]:
+        """Creates the instances for a request from the factories previously looked up for it."""
         if many:
             if named:
-                instances = {comp.qualifiers[NAME]: factory()
+                instances = {comp.qualifiers[NAME]: self._create(comp, factory)
                              for (comp, factory) in factories.items() if NAME in comp.qualifiers}
             else:
-                instances = tuple(factory() for factory in factories.values())
+                instances = tuple(self._create(comp, factory) for (comp, factory) in factories.items())
             return instances
         elif named:
             raise ValueError("Parameter 'named=True' can only be used with 'many=True'.")
@@ -59,21 +107,84 @@ class Registry(InjectionContext):
         elif len(factories) > 1:
             raise AmbiguousDependencyException(
                 f'Dependency resolution for {request} is ambiguous: {" | ".join(str(c) for c in factories.keys())}')
-        return next(iter(factories.values()))()
+        return self._create(*next(iter(factories.items())))
 
 
 class DictRegistry(Registry):
 
     def __init__(self):
         self._factories: dict[Component[T], Factory[T]] = dict()
+        self._positions: dict[Component[T], int] = dict()
+        self._components_by_target: dict[type, list[Component[T]]] = dict()
+        self._compatible: dict[type, tuple[frozenset[type], tuple[Component[T], ...]]] = dict()
+        self._components_by_param: dict[str, dict[str, list[Component[T]]]] = dict()
+        self._sorted_param_values: dict[str, list[str]] = dict()
         super(DictRegistry, self).__init__()
 
     def register(self, component: Component[T], factory: Factory[T]) -> None:
         if component in self._factories:
             raise ResolutionException(f"Cannot register multiple providers for '{component}'.")
         self._factories[component] = factory
+        self._positions[component] = len(self._positions)
+        self._components_by_target.setdefault(component.target, list()).append(component)
+        self._compatible.clear()
+        for (key, value) in component.qualifiers.params:
+            self._components_by_param.setdefault(key, dict()).setdefault(value, list()).append(component)
+            self._sorted_param_values.pop(key, None)
+        self._version += 1
+
+    def items(self) -> dict[Component[T], Factory[T]]:
+        return dict(self._factories)
+
+    def _get_compatible(self, target: type[T]) -> tuple[frozenset[type], tuple[Component[T], ...]]:
+        """Returns the registered targets assignable to the requested target and their components in registration
+        order, memoized until the next registration."""
+        compatible = self._compatible.get(target)
+        if compatible is None:
+            targets = frozenset(t for t in self._components_by_target.keys() if is_assignable(t, target))
+            components = tuple(sorted((c for t in targets for c in self._components_by_target[t]),
+                                      key=self._positions.__getitem__))
+            compatible = self._compatible[target] = (targets, components)
+        return compatible
+
+    def _get_values_with_prefix(self, key: str, prefix: str) -> list[str]:
+        values = self._sorted_param_values.get(key)
+        if values is None:
+            values = sorted(v for v in self._components_by_param[key].keys() if isinstance(v, str))
+            self._sorted_param_values[key] = values
+        idx = bisect_left(values, prefix)
+        matches = list()
+        while idx < len(values) and values[idx].startswith(prefix):
+            matches.append(values[idx])
+            idx += 1
+        return matches
+
+    def _select_by_params(self, qualifiers: Qualifiers) -> set[Component[T]] | None:
+        """Selects the components matching the indexable parameters, None if there are none to select by."""
+        selected = None
+        for (key, value) in qualifiers.params:
+            by_value = self._components_by_param.get(key, dict())
+            if isinstance(value, Prefix):
+                values = self._get_values_with_prefix(key, value.prefix) if len(by_value) else list()
+            elif isinstance(value, OneOf):
+                values = value.values
+            elif isinstance(value, str):
+                values = (value,)
+            else:  # Opaque selector, evaluated by Qualifiers.is_superset.
+                continue
+            matches = set(c for v in values for c in by_value.get(v, tuple()))
+            selected = matches if selected is None else selected.intersection(matches)
+            if len(selected) == 0:
+                break
+        return selected
 
     def lookup(self, request: Component[T], *, constraint: Constraint = Unconstrained) -> dict[Component[T], Factory[T]]:
-        return {comp: factory for (comp, factory) in self._factories.items() if comp.satisfies(request) and constraint(comp)}
-
-
+        (targets, components) = self._get_compatible(request.target)
+        selected = self._select_by_params(request.qualifiers)
+        if selected is None:
+            candidates = components
+        else:
+            candidates = (comp for comp in sorted(selected, key=self._positions.__getitem__) if comp.target in targets)
+        return {comp: self._factories[comp]
+                for comp in candidates
+                if request.qualifiers.is_subset(comp.qualifiers) and constraint(comp)}
@@ -1,17 +1,77 @@
+from typing import Callable, Any
+
 from makefun import wraps
 
 
-def singleton():
+TRANSIENT: str = 'transient'
+SINGLETON: str = 'singleton'
+
+
+class Scope(object):
+    """Declares the lifetime of the instances created by the providers it is attached to.
+
+    Resetting a scope discards the instances created so far and invalidates resolved values cached by
+    injectors, the next resolution creates new instances.
+    """
+
+    def __init__(self, lifetime: str = SINGLETON):
+        self._lifetime = lifetime
+        self._generation: int = 0
+        self._on_reset: dict[Callable[[], None], None] = dict()
+
+    @property
+    def lifetime(self) -> str:
+        return self._lifetime
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def on_reset(self, callback: Callable[[], None]) -> None:
+        """Registers a callback to be called on every reset, registering an equal callback again has no effect."""
+        self._on_reset[callback] = None
+
+    def reset(self) -> None:
+        self._generation += 1
+        for callback in list(self._on_reset.keys()):
+            callback()
+
+
+def get_scope(factory: Callable[..., Any]) -> Scope | None:
+    return getattr(factory, 'scope', None)
+
+
+def singleton(scope: Scope | None = None):
+    if scope is None:
+        scope = Scope(SINGLETON)
+    elif scope.lifetime != SINGLETON:
+        raise ValueError(f"Scope with lifetime '{scope.lifetime}' cannot be used as singleton.")
+
     def _decorator(func):
         instance = None
+        generation = None
 
         @wraps(func)
         def _wrapper(*args, **kwargs):
-            nonlocal instance
-            if instance is None:
+            nonlocal instance, generation
+            if generation != scope.generation:
                 instance = func(*args, **kwargs)
+                generation = scope.generation
             return instance
 
+        def _release() -> None:
+            nonlocal instance
+            instance = None
+
+        def _is_cached() -> bool:
+            return generation == scope.generation
+
+        def _get_instance():
+            return instance if _is_cached() else None
+
+        scope.on_reset(_release)
+        _wrapper.scope = scope
+        _wrapper.is_cached = _is_cached
+        _wrapper.get_instance = _get_instance
         return _wrapper
     return _decorator
-
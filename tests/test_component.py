@@ -0,0 +1,125 @@
+from typing import Callable, Any, Optional
+
+import pytest
+
+from pydi import Container, Inject
+from pydi.component import Component, is_assignable
+from pydi.qualifiers import Qualifiers, Prefix, ANY
+from pydi.registry import DictRegistry, AmbiguousDependencyException
+
+
+class Base:
+    pass
+
+
+class Derived(Base):
+    pass
+
+
+@pytest.mark.parametrize('provided, requested, expected', [
+    pytest.param(int, int, True, id='same'),
+    pytest.param(Derived, Base, True, id='subclass'),
+    pytest.param(Base, Derived, False, id='superclass'),
+    pytest.param(Callable[[int, float], float], Callable, True, id='callable-bare'),
+    pytest.param(Callable[[int, float], float], Callable[..., float], True, id='callable-ellipsis'),
+    pytest.param(Callable[[int, float], float], Callable[[int, float], float], True, id='callable-same'),
+    pytest.param(Callable[[int, float], float], Callable[[int], float], False, id='callable-arity'),
+    pytest.param(Callable[[int, float], float], Callable[[int, int], float], False, id='callable-params'),
+    pytest.param(Callable[[int], int], Callable[[int], float], False, id='callable-return'),
+    pytest.param(Callable[[Base], Derived], Callable[[Derived], Base], True, id='callable-variance'),
+    pytest.param(Callable[[Derived], Base], Callable[[Base], Derived], False, id='callable-variance-wrong'),
+    pytest.param(Callable[[int], float], Callable[[int], Any], True, id='callable-any'),
+    pytest.param(list[Derived], list[Base], True, id='generic-covariant'),
+    pytest.param(list[int], list[float], False, id='generic-args'),
+    pytest.param(list, list[int], True, id='generic-raw'),
+    pytest.param(dict[str, int], dict[str, int], True, id='generic-multiple'),
+    pytest.param(tuple[int, int], tuple[int, ...], True, id='tuple-fixed-to-variadic'),
+    pytest.param(tuple[int, Derived], tuple[Base, ...], False, id='tuple-fixed-to-variadic-args'),
+    pytest.param(tuple[Derived, Derived], tuple[Base, ...], True, id='tuple-fixed-to-variadic-covariant'),
+    pytest.param(tuple[Derived, ...], tuple[Base, ...], True, id='tuple-variadic'),
+    pytest.param(tuple[int, ...], tuple[float, ...], False, id='tuple-variadic-args'),
+    pytest.param(tuple[int, ...], tuple[int, int], False, id='tuple-variadic-to-fixed'),
+    pytest.param(tuple[int, int], tuple[int], False, id='tuple-length'),
+    pytest.param(int, int | None, True, id='union-requested'),
+    pytest.param(Derived, Optional[Base], True, id='union-requested-typing'),
+    pytest.param(float, int | None, False, id='union-requested-mismatch'),
+    pytest.param(int | None, int, False, id='union-provided'),
+    pytest.param(Derived | None, Base | None, True, id='union-both'),
+    pytest.param(list[int], list[int | str], True, id='union-argument'),
+    pytest.param(Callable[[int | str], int], Callable[[int], int | None], True, id='union-callable'),
+    pytest.param(Callable[[Any, int], int], Callable[[int, int], int], True, id='callable-any-param'),
+    pytest.param(Callable[[int], Any], Callable[[int], int], True, id='callable-any-return'),
+])
+def test_is_assignable(provided, requested, expected):
+    assert is_assignable(provided, requested) == expected
+
+
+def test_DictRegistry_lookup_order():
+    registry = DictRegistry()
+    registry.register(Component(Base, Qualifiers.for_provider(name='a')), lambda: 'a')
+    registry.register(Component(Derived, Qualifiers.for_provider(name='b')), lambda: 'b')
+    registry.register(Component(Base, Qualifiers.for_provider(name='c')), lambda: 'c')
+    assert registry.resolve(Component(Base, Qualifiers(ANY)), many=True) == ('a', 'b', 'c')
+    assert registry.resolve(Component(Base, Qualifiers(ANY, name=Prefix(''))), many=True) == ('a', 'b', 'c')
+    assert registry.resolve(Component(Base, Qualifiers(ANY, name=lambda _: True)), many=True) == ('a', 'b', 'c')
+
+
+def test_DictRegistry_lookup_callable():
+    registry = DictRegistry()
+    providers = {
+        Component(Callable[[int, float, float], float], Qualifiers('default')): lambda: 'match',
+        Component(Callable[[int], float], Qualifiers('default')): lambda: 'arity',
+        Component(Callable[[int, float, float], int], Qualifiers('default')): lambda: 'return',
+    }
+    for (component, factory) in providers.items():
+        registry.register(component, factory)
+
+    assert registry.resolve(Component(Callable[[int, float, float], float], Qualifiers('default'))) == 'match'
+    with pytest.raises(AmbiguousDependencyException):
+        registry.resolve(Component(Callable[..., float], Qualifiers('default')))
+    assert len(registry.lookup(Component(Callable, Qualifiers('default')))) == 3
+
+    registry.register(Component(Callable[[int, float, float], float], Qualifiers('alternative')), lambda: 'new')
+    assert len(registry.lookup(Component(Callable[[int, float, float], float], Qualifiers()))) == 2
+
+
+def test_DictRegistry_lookup_selectors():
+    registry = DictRegistry()
+    for (name, version) in [('http.get', '1'), ('http.post', '2'), ('grpc.call', '2'), ('http.put', '3')]:
+        registry.register(Component(Base, Qualifiers.for_provider(name=name, version=version)), lambda n=name: n)
+    registry.register(Component(Derived, Qualifiers.for_provider(name='http.head', version='2')), lambda: 'http.head')
+    registry.register(Component(int, Qualifiers.for_provider(name='http.int', version='2')), lambda: 'http.int')
+
+    def _names(**params):
+        return registry.resolve(Component(Base, Qualifiers(ANY, **params)), many=True)
+
+    assert _names(name=Prefix('http.')) == ('http.get', 'http.post', 'http.put', 'http.head')
+    assert _names(name=Prefix('http.'), version={'2', '3'}) == ('http.post', 'http.put', 'http.head')
+    assert _names(version='2', name=lambda n: n.endswith('t')) == ('http.post',)
+    assert _names(name=Prefix('ftp.')) == tuple()
+    assert _names(label='missing') == tuple()
+    assert len(registry.lookup(Component(int, Qualifiers(ANY, name=Prefix('http'))))) == 1
+
+
+def test_Component_str():
+    assert str(Component(int, Qualifiers('default'))) == 'builtins.int[default]'
+    assert str(Component(Callable[[int, int], int], Qualifiers('default'))) == 'typing.Callable[[int, int], int][default]'
+    assert str(Component(int | None, Qualifiers('default'))) == 'int | None[default]'
+
+
+def test_Container_resolve_union_and_unannotated():
+    container = Container('unannotated')
+
+    @container.provides()
+    def get_int() -> int:
+        return 3
+
+    @container.provides(function=True)
+    def add(a, b: int):
+        return a + b
+
+    @container.inject()
+    def main(i: Inject[int | None], f: Inject[Callable[[int, int], int]]):
+        return f(i, 1)
+
+    assert main() == 4
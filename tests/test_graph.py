@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from pydi import Container, Inject, singleton
+from pydi.graph import CyclicDependencyException
+
+
+def test_Container_graph():
+    container = Container('graph')
+    internal = Container('graph_internal')
+    internal.expose_to(container, int)
+    calls = list()
+
+    @internal.provides()
+    def get_int() -> int:
+        calls.append(int)
+        return 1
+
+    @container.provides()
+    @singleton()
+    @container.inject()
+    def get_float(i: Inject[int]) -> float:
+        calls.append(float)
+        return float(i)
+
+    @container.provides()
+    @container.inject()
+    def get_str(f: Inject[float], i: Inject[int], b: Inject[bytes], *others: Inject[complex]) -> str:
+        calls.append(str)
+        return str(f)
+
+    graph = container.graph()
+    assert calls == []
+    nodes = {n[1].target: n for n in graph.nodes}
+    assert set(nodes.keys()) == {int, float, str}
+    assert nodes[int][0] is internal
+    assert graph.edges[nodes[str]] == (nodes[float], nodes[int])
+    assert [graph.depth(nodes[t]) for t in (int, float, str)] == [0, 1, 2]
+    assert [graph.fan_out(nodes[t]) for t in (int, float, str)] == [0, 1, 2]
+    assert [c.target for c in graph.unsatisfied[nodes[str]]] == [bytes]
+    assert graph.cycles() == []
+    graph.check()
+
+    exported = json.loads(graph.to_json())
+    assert len(exported['nodes']) == 3 and len(exported['edges']) == 3
+    dot = graph.to_dot()
+    assert dot.startswith('digraph dependencies {')
+    assert '"graph:builtins.str[any,default]" -> "graph_internal:builtins.int[any,default]";' in dot
+
+
+def test_Container_graph_cycles():
+    container = Container('cyclic')
+
+    @container.provides()
+    @container.inject()
+    def get_int(f: Inject[float]) -> int:
+        return int(f)
+
+    @container.provides()
+    @container.inject()
+    def get_float(i: Inject[int]) -> float:
+        return float(i)
+
+    @container.provides()
+    @container.inject()
+    def get_str(i: Inject[int]) -> str:
+        return str(i)
+
+    @container.provides()
+    @container.inject()
+    def get_bytes(b: Inject[bytes]) -> bytes:
+        return b
+
+    graph = container.graph()
+    cycles = [set(n[1].target for n in cycle) for cycle in graph.cycles()]
+    assert sorted(cycles, key=len) == [{bytes}, {int, float}]
+    assert all(graph.depth(n) is None for n in graph.nodes)
+    with pytest.raises(CyclicDependencyException):
+        graph.check()
+    assert json.loads(graph.to_json())['cycles']
+
+
+def test_Container_graph_callable_ids():
+    container = Container('functions')
+
+    @container.provides(function=True)
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    @container.provides(function=True)
+    def scale(a: float) -> float:
+        return 2 * a
+
+    graph = container.graph()
+    exported = json.loads(graph.to_json())
+    ids = [n['id'] for n in exported['nodes']]
+    assert ids == ['functions:typing.Callable[[int, int], int][any,default]',
+                   'functions:typing.Callable[[float], float][any,default]']
+    assert sum(1 for line in graph.to_dot().splitlines() if '[label=' in line) == 2
@@ -0,0 +1,103 @@
+import gc
+import tracemalloc
+from types import FrameType
+
+import pytest
+
+from pydi import Container, singleton, Scope, Inject
+from pydi.component import Component
+from pydi.qualifiers import Qualifiers
+
+
+def test_Container_memory_report():
+    container = Container('tracked')
+    internal = Container('tracked_internal')
+    internal.expose_to(container, bytearray)
+    scope = Scope()
+
+    @internal.provides()
+    def get_buffer() -> bytearray:
+        return bytearray(100_000)
+
+    @container.provides()
+    @singleton(scope)
+    @container.inject()
+    def get_list(buffer: Inject[bytearray]) -> list:
+        return [buffer, bytearray(50_000)]
+
+    with pytest.raises(ValueError):
+        container.memory_report()
+
+    request = Component(list, Qualifiers.for_injector())
+    with container.track_memory():
+        instance = container.resolve(request)
+        assert container.resolve(request) is instance
+        assert container.resolve(request) is instance
+        report = container.memory_report()
+        lst = report[(container.registry, Component(list, Qualifiers.for_provider()))]
+        buffer = report[(internal.registry, Component(bytearray, Qualifiers.for_provider()))]
+
+        assert buffer.created == 1 and lst.created == 1
+        assert buffer.allocated_bytes >= 100_000
+        assert buffer.retained_bytes is None
+        assert lst.allocated_bytes >= 150_000
+        assert 50_000 <= lst.self_bytes < 100_000
+        assert lst.retained_bytes >= 150_000
+
+        scope.reset()
+        assert container.memory_report()[(lst.registry, lst.component)].retained_bytes is None
+        assert [r for r in gc.get_referrers(instance) if not isinstance(r, FrameType)] == []
+
+        container.resolve(request)
+        assert container.memory_report()[(lst.registry, lst.component)].created == 2
+    assert internal.registry.memory_tracker is None
+    assert container.registry.memory_tracker is None
+
+
+def test_Container_track_memory_overlapping():
+    assert not tracemalloc.is_tracing()
+    a = Container('tracked_a')
+    b = Container('tracked_b')
+    a.expose_to(b, list)
+
+    with a.track_memory() as tracker_a:
+        with b.track_memory() as tracker_b:
+            assert tracker_b is tracker_a
+        assert a.registry.memory_tracker is tracker_a
+        assert tracemalloc.is_tracing()
+    assert not tracemalloc.is_tracing()
+
+    with b.track_memory() as tracker_b:
+        with a.track_memory() as tracker_a:
+            assert tracker_a is tracker_b
+    assert not tracemalloc.is_tracing()
+    assert a.registry.memory_tracker is None and b.registry.memory_tracker is None
+
+
+def test_Container_memory_report_containers():
+    c = Container('tracked_c')
+    d = Container('tracked_d')
+    d.expose_to(c, list)
+
+    @c.provides('x')
+    @singleton()
+    def get_small() -> list:
+        return [None] * 10
+
+    @d.provides('x')
+    @singleton()
+    def get_large() -> list:
+        return [None] * 100_000
+
+    request = Component(list, Qualifiers.for_injector('x'))
+    with c.track_memory():
+        small = c.registry.resolve(request)
+        large = d.registry.resolve(request)
+        report = c.memory_report()
+    component = Component(list, Qualifiers.for_provider('x'))
+    assert set(report.keys()) == {(c.registry, component), (d.registry, component)}
+    assert report[(c.registry, component)].created == 1
+    assert report[(d.registry, component)].created == 1
+    assert report[(c.registry, component)].retained_bytes < 1000
+    assert report[(d.registry, component)].retained_bytes >= 800_000
+    assert len(small) == 10 and len(large) == 100_000
@@ -0,0 +1,102 @@
+from time import sleep
+
+from typing import Callable
+
+from pydi import Container, Inject
+from pydi.component import Component
+from pydi.qualifiers import Qualifiers
+
+
+def test_Container_profile():
+    container = Container('profiled')
+    internal = Container('profiled_internal')
+    internal.expose_to(container, int)
+
+    @internal.provides()
+    def get_int() -> int:
+        sleep(0.02)
+        return 1
+
+    @container.provides()
+    @container.inject()
+    def get_float(i: Inject[int]) -> float:
+        return float(i)
+
+    @container.provides()
+    def get_str() -> str:
+        return 'fast'
+
+    @container.inject()
+    def main(f: Inject[float], s: Inject[str]):
+        return f, s
+
+    with container.profile() as profiler:
+        assert main() == (1.0, 'fast')
+    assert internal.registry.profiler is None
+    main()
+
+    assert [n.component.target for n in profiler.roots] == [float, str]
+    path = profiler.critical_path()
+    assert [n.component.target for n in path] == [float, int]
+    assert path[0].wall_time >= path[1].wall_time >= 0.02
+    assert path[0].self_time < path[1].self_time
+
+    summary = profiler.summary()
+    assert len(summary) == 3
+    assert (internal.registry, Component(int, Qualifiers.for_provider())) in summary
+
+    lines = profiler.to_collapsed().splitlines()
+    assert len(lines) == 3
+    assert lines[1].startswith('test_Container_profile.<locals>.get_float(builtins.float[any,default]);'
+                               'test_Container_profile.<locals>.get_int(builtins.int[any,default]) ')
+    assert int(lines[1].rsplit(' ', 1)[1]) >= 20000
+
+
+def test_Container_profile_containers():
+    container = Container('profiled_outer')
+    other = Container('profiled_other')
+    other.expose_to(container, int)
+
+    @container.provides()
+    def get_int() -> int:
+        return 1
+
+    @other.provides('other')
+    def get_other_int() -> int:
+        sleep(0.01)
+        return 2
+
+    @container.provides(function=True)
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    @container.inject()
+    def main(i: Inject[int], j: container.inject(int, 'other'), f: Inject[Callable[[int, int], int]]):
+        return f(i, j)
+
+    with container.profile() as profiler:
+        assert main() == 3
+    summary = profiler.summary()
+    assert set(summary.keys()) == {(container.registry, Component(int, Qualifiers.for_provider())),
+                                   (other.registry, Component(int, Qualifiers.for_provider('other'))),
+                                   (container.registry, Component(Callable[[int, int], int], Qualifiers.for_provider()))}
+    assert summary[(other.registry, Component(int, Qualifiers.for_provider('other')))][0] >= 0.01
+    assert 'typing.Callable[[int, int], int][any,default]' in profiler.to_collapsed()
+
+
+def test_Container_profile_memory_tracking():
+    container = Container('profiled_tracked')
+
+    @container.provides()
+    def get_buffer() -> bytearray:
+        return bytearray(1000)
+
+    @container.provides()
+    @container.inject()
+    def get_list(buffer: Inject[bytearray]) -> list:
+        return [buffer]
+
+    with container.track_memory(), container.profile() as profiler:
+        container.resolve(Component(list, Qualifiers.for_injector()))
+    assert [n.component.target for n in profiler.critical_path()] == [list, bytearray]
+    assert profiler.critical_path()[0].name.startswith('test_Container_profile_memory_tracking.<locals>.get_list(')
@@ -1,6 +1,6 @@
 import pytest
 
-from pydi.qualifiers import Qualifiers, qualifiers, ANY, DEFAULT, ALTERNATIVE
+from pydi.qualifiers import Qualifiers, qualifiers, ANY, DEFAULT, ALTERNATIVE, Prefix, OneOf, Predicate
 
 
 args_sample = pytest.mark.parametrize('tags, params', [
@@ -90,3 +90,17 @@ def test_Qualifiers_is_superset(tags, params):
 @args_sample
 def test_qualifiers(tags, params):
     assert qualifiers(*tags, **params) == Qualifiers.for_injector(*tags, **params)
+
+
+def test_Qualifiers_selectors():
+    provider = Qualifiers.for_provider(name='http.get', version='2')
+    assert provider.is_superset(qualifiers(name=Prefix('http.')))
+    assert not provider.is_superset(qualifiers(name=Prefix('grpc.')))
+    assert provider.is_superset(qualifiers(version={'1', '2'}))
+    assert not provider.is_superset(qualifiers(version={'1', '3'}))
+    assert provider.is_superset(qualifiers(name=lambda n: n.endswith('.get'), version=OneOf('2')))
+    assert not provider.is_superset(qualifiers(name=Predicate(lambda n: n.endswith('.post'))))
+    assert qualifiers(version={'1', '2'}) == qualifiers(version=OneOf('2', '1'))
+    assert str(qualifiers(name=Prefix('http.'), version={'2', '1'})) == 'name=http.*,version={1|2}'
+    with pytest.raises(ValueError):
+        Qualifiers.for_provider(name=Prefix('http.'))
@@ -0,0 +1,115 @@
+import gc
+import weakref
+
+import pytest
+
+from pydi import Container, Inject, singleton, Scope
+from pydi.scopes import TRANSIENT
+
+
+def test_singleton_reset():
+    scope = Scope()
+    calls = list()
+
+    @singleton(scope)
+    def create() -> object:
+        calls.append(None)
+        return object()
+
+    first = create()
+    assert create() is first
+    scope.reset()
+    assert create() is not first
+    assert len(calls) == 2
+
+    with pytest.raises(ValueError):
+        singleton(Scope(TRANSIENT))
+
+
+def test_inject_caches_singletons():
+    container = Container('scoped')
+    scope = Scope()
+    calls = {'int': 0, 'float': 0}
+
+    @container.provides()
+    @singleton(scope)
+    def get_int() -> int:
+        calls['int'] += 1
+        return calls['int']
+
+    @container.provides()
+    def get_float() -> float:
+        calls['float'] += 1
+        return float(calls['float'])
+
+    @container.inject()
+    def main(a: str, i: Inject[int], f: Inject[float]):
+        return a, i, f
+
+    resolved = _count_lookups(container)
+
+    assert main('a') == ('a', 1, 1.0)
+    assert main('b') == ('b', 1, 2.0)
+    assert resolved == [int, float, float]
+
+    scope.reset()
+    assert main('c') == ('c', 2, 3.0)
+    assert resolved == [int, float, float, int, float]
+
+    @container.provides('alternative')
+    def get_other_int() -> int:
+        return 0
+
+    assert main('d') == ('d', 2, 4.0)
+    assert resolved[-2:] == [int, float]
+
+
+def _count_lookups(container: Container) -> list[type]:
+    looked_up = list()
+    original = container.registry.lookup
+
+    def _lookup(request, **kwargs):
+        looked_up.append(request.target)
+        return original(request, **kwargs)
+    container.registry.lookup = _lookup
+    return looked_up
+
+
+def test_inject_transient_lookups():
+    container = Container('transient')
+
+    @container.provides()
+    def get_int() -> int:
+        return 1
+
+    @container.inject()
+    def main(i: Inject[int]):
+        return i
+
+    looked_up = _count_lookups(container)
+    assert main() == 1 and main() == 1
+    assert looked_up == [int, int]
+
+
+def test_inject_releases_reset_singletons():
+    container = Container('released')
+    scope = Scope()
+
+    class Big:
+        pass
+
+    @container.provides()
+    @singleton(scope)
+    def get_big() -> Big:
+        return Big()
+
+    @container.inject()
+    def handler(big: Inject[Big]):
+        return weakref.ref(big)
+
+    reference = handler()
+    assert reference() is not None
+    scope.reset()
+    gc.collect()
+    assert reference() is None
+    assert handler()() is not None